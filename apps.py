@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ApitestsConfig(AppConfig):
     name = 'api_tests'
+
+    def ready(self):
+        from . import registry
+        registry.build(self)
@@ -0,0 +1,48 @@
+from contextvars import ContextVar
+from django.test.utils import TestContextDecorator
+
+# Lets the AVAILABILITY of a model be changed for the current thread or async task only.
+# Models declare AVAILABILITY = Availability('public') and the API reads model.AVAILABILITY as normal, the value
+# comes from the innermost override_availability for that model or the declared default if there is none.
+# Nothing is written to the model class so overrides in parallel tests or concurrent requests cannot see each other.
+
+_overrides = ContextVar('api_tests_availability_overrides', default={})
+# the tokens to undo the overrides entered in this context, innermost last
+_tokens = ContextVar('api_tests_availability_tokens', default=())
+
+
+class Availability:
+
+    def __init__(self, default):
+        self.default = default
+
+    def __get__(self, instance, owner):
+        return _overrides.get().get(owner, self.default)
+
+
+def has_availability(model):
+    return any(isinstance(cls.__dict__.get('AVAILABILITY'), Availability) for cls in model.__mro__)
+
+
+class override_availability(TestContextDecorator):
+    # use as a context manager, a function decorator or a TestCase class decorator, e.g.
+    #     with override_availability(models.Review, None):
+    #     @override_availability(models.Author, 'project')
+
+    def __init__(self, model, availability):
+        if not has_availability(model):
+            raise ValueError('{} does not declare AVAILABILITY with Availability()'.format(model.__name__))
+        self.model = model
+        self.availability = availability
+        super().__init__()
+
+    def enable(self):
+        overrides = dict(_overrides.get())
+        overrides[self.model] = self.availability
+        token = _overrides.set(overrides)
+        _tokens.set(_tokens.get() + (token,))
+
+    def disable(self):
+        tokens = _tokens.get()
+        _tokens.set(tokens[:-1])
+        _overrides.reset(tokens[-1])
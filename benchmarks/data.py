@@ -0,0 +1,55 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from api_tests import models, seeding
+
+User = get_user_model()
+
+DEFAULT_VOLUMES = {'users': 20,
+                   'authors': 200,
+                   'works_per_author': 3,
+                   'editions_per_work': 2,
+                   'reviews_per_work': 3,
+                   'projects': 20,
+                   'editors_per_project': 3,
+                   'works_per_project': 5,
+                   'plans_per_project': 5,
+                   'editors_per_plan': 2}
+
+
+def seed(volumes=None, random_seed=1):
+    # fills an empty database with benchmark data and returns the ids the scenarios need
+    config = dict(DEFAULT_VOLUMES)
+    if volumes is not None:
+        config.update(volumes)
+    seeding.seed(config, random_seed)
+    superuser_id = User.objects.filter(groups__name='api_tests_superusers').order_by('id').first().id
+    # the owner is the user of the first review (other than the superuser's) so they own records in the private models
+    owner_id = models.Review.objects.exclude(user_id=superuser_id).order_by('id') \
+        .values_list('user_id', flat=True).first()
+    project = models.Project.objects.order_by('id').first()
+    project_member_id = project.editors.exclude(id=superuser_id).order_by('id').values_list('id', flat=True).first()
+    return {'volumes': config,
+            'owner_id': owner_id,
+            'superuser_id': superuser_id,
+            'project_id': project.id,
+            'project_member_id': project_member_id or project.managing_editor_id,
+            'author_ids': list(models.Author.objects.order_by('id').values_list('id', flat=True)[:3]),
+            'author_identifiers': list(models.Author.objects.order_by('id').values_list('identifier', flat=True)[:3]),
+            'work_ids': list(models.Work.objects.order_by('id').values_list('id', flat=True)[:3]),
+            'detail_ids': get_detail_ids(owner_id)}
+
+
+def get_api_models():
+    # the models the API serves, Project has no serializer so it is only used through PublicationPlan
+    return [model for model in apps.get_app_config('api_tests').get_models() if hasattr(model, 'SERIALIZER')]
+
+
+def get_detail_ids(owner_id):
+    # one record of each model to request in detail, the owner's own record where the model has a user
+    detail_ids = {}
+    for model in get_api_models():
+        queryset = model.objects.order_by('id')
+        if 'user' in [field.name for field in model._meta.fields] and queryset.filter(user_id=owner_id).exists():
+            queryset = queryset.filter(user_id=owner_id)
+        detail_ids[model._meta.model_name] = queryset.values_list('id', flat=True).first()
+    return detail_ids
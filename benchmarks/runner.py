@@ -0,0 +1,90 @@
+import math
+import statistics
+import time
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from . import data, scenarios
+
+User = get_user_model()
+
+
+def percentile(values, percent):
+    # nearest rank
+    ordered = sorted(values)
+    index = max(int(math.ceil(percent / 100 * len(ordered))) - 1, 0)
+    return ordered[index]
+
+
+def get_users(fixtures):
+    users = {'anonymous': None,
+             'owner': User.objects.get(id=fixtures['owner_id']),
+             'superuser': User.objects.get(id=fixtures['superuser_id']),
+             'project_member': User.objects.get(id=fixtures['project_member_id'])}
+    return users
+
+
+def get_url(scenario):
+    if scenario['query'] == '':
+        return scenario['path']
+    return '{}?{}'.format(scenario['path'], scenario['query'])
+
+
+def call_client(scenario, user):
+    client = APIClient()
+    if user is not None:
+        client.force_login(user)
+
+    def call():
+        return client.get(get_url(scenario))
+    return call
+
+
+def call_view(scenario, user):
+    # skips the middleware and url routing that the client goes through
+    factory = APIRequestFactory()
+    match = resolve(scenario['path'])
+
+    def call():
+        request = factory.get(get_url(scenario))
+        if user is not None:
+            force_authenticate(request, user=user)
+        response = match.func(request, *match.args, **match.kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+    return call
+
+
+def time_scenario(call, repeats):
+    # one untimed call first so one off costs (url resolving, caches) are not counted
+    response = call()
+    timings = []
+    with CaptureQueriesContext(connection) as queries:
+        for i in range(repeats):
+            start = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - start) * 1000)
+    return {'status': response.status_code,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'mean_ms': round(statistics.mean(timings), 3),
+            'queries': len(queries) // repeats}
+
+
+def run(volumes=None, repeats=20, modes=None, random_seed=1):
+    # expects an empty (test) database, see the benchmark_api management command
+    if modes is None:
+        modes = ['client', 'view']
+    callers = {'client': call_client, 'view': call_view}
+    fixtures = data.seed(volumes, random_seed)
+    users = get_users(fixtures)
+    results = []
+    for scenario in scenarios.get_scenarios(fixtures):
+        for mode in modes:
+            result = {'scenario': scenario['name'], 'mode': mode, 'user': scenario['user'], 'url': get_url(scenario)}
+            result.update(time_scenario(callers[mode](scenario, users[scenario['user']]), repeats))
+            results.append(result)
+    return {'volumes': fixtures['volumes'], 'repeats': repeats, 'database': connection.vendor, 'results': results}
@@ -0,0 +1,66 @@
+# Each scenario is one request to time. 'user' is one of the roles below and 'path' is the url under /api/.
+# The matrix covers each filter type, _sort, _fields and paging depth on a public model plus every availability mode.
+
+LIST_URL = '/api/api_tests/{}/'
+DETAIL_URL = '/api/api_tests/{}/{}'
+
+ROLES = ['anonymous', 'owner', 'superuser', 'project_member']
+
+# models whose availability needs the project to be given in the request
+PROJECT_MODELS = ['publicationplan']
+
+
+def get_scenarios(fixtures):
+    authors = fixtures['volumes']['authors']
+    identifiers = fixtures['author_identifiers']
+    scenarios = [
+        # filter types
+        ('author_list', 'anonymous', LIST_URL.format('author'), ''),
+        ('author_filter_exact', 'anonymous', LIST_URL.format('author'), 'age=28'),
+        ('author_filter_wildcard', 'anonymous', LIST_URL.format('author'), 'name=*Sm*'),
+        ('author_filter_wildcard_case', 'anonymous', LIST_URL.format('author'), 'name=j*|i'),
+        ('author_filter_list', 'anonymous', LIST_URL.format('author'), 'identifier={}'.format(','.join(identifiers))),
+        ('author_filter_date', 'anonymous', LIST_URL.format('author'), 'date_joined=>1990'),
+        ('work_filter_related', 'anonymous', LIST_URL.format('work'), 'author__identifier={}'.format(identifiers[0])),
+        ('edition_filter_related', 'anonymous', LIST_URL.format('edition'),
+         'work__author__identifier={}'.format(identifiers[0])),
+        # sorting and field selection
+        ('author_sort', 'anonymous', LIST_URL.format('author'), '_sort=name'),
+        ('author_fields', 'anonymous', LIST_URL.format('author'), '_fields=id,name'),
+        ('work_sort_related', 'anonymous', LIST_URL.format('work'), '_sort=author__name'),
+        # paging depth
+        ('author_page_first', 'anonymous', LIST_URL.format('author'), 'limit=100&offset=0'),
+        ('author_page_middle', 'anonymous', LIST_URL.format('author'), 'limit=100&offset={}'.format(authors // 2)),
+        ('author_page_last', 'anonymous', LIST_URL.format('author'),
+         'limit=100&offset={}'.format(max(authors - 100, 0))),
+        # detail
+        ('author_detail', 'anonymous', DETAIL_URL.format('author', fixtures['author_ids'][0]), ''),
+        ('work_detail', 'anonymous', DETAIL_URL.format('work', fixtures['work_ids'][0]), ''),
+    ]
+    # availability modes
+    for role in ['owner', 'superuser']:
+        # private
+        scenarios.append(('review_list_{}'.format(role), role, LIST_URL.format('review'), ''))
+        # logged_in
+        scenarios.append(('editor_list_{}'.format(role), role, LIST_URL.format('editor'), ''))
+    # public_or_user
+    for role in ['anonymous', 'owner', 'superuser']:
+        scenarios.append(('decision_list_{}'.format(role), role, LIST_URL.format('decision'), ''))
+    # project
+    for role in ['project_member', 'superuser']:
+        scenarios.append(('publicationplan_list_{}'.format(role), role, LIST_URL.format('publicationplan'),
+                          'project__id={}'.format(fixtures['project_id'])))
+    return [{'name': name, 'user': user, 'path': path, 'query': query} for name, user, path, query in scenarios]
+
+
+def get_budget_scenarios(fixtures):
+    # a list and a detail request for each model the API serves, as each role (see test_budgets.py)
+    budget_scenarios = []
+    for model_name, detail_id in sorted(fixtures['detail_ids'].items()):
+        query = 'project__id={}'.format(fixtures['project_id']) if model_name in PROJECT_MODELS else ''
+        for role in ROLES:
+            budget_scenarios.append({'name': '{}_list_{}'.format(model_name, role), 'user': role,
+                                     'path': LIST_URL.format(model_name), 'query': query})
+            budget_scenarios.append({'name': '{}_detail_{}'.format(model_name, role), 'user': role,
+                                     'path': DETAIL_URL.format(model_name, detail_id), 'query': query})
+    return budget_scenarios
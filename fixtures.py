@@ -0,0 +1,155 @@
+import os
+from django.conf import settings
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from api_tests import models
+
+# Builders for the publishing scenario used by the API tests. They are called from setUpTestData so the data is
+# created once per test class and each test's changes are rolled back at the end of the test.
+# Set API_TESTS_FAST_PASSWORD_HASHER=1 to hash the test users' passwords with a fast (insecure) hasher.
+
+User = get_user_model()
+
+FAST_PASSWORD_HASHER = os.environ.get('API_TESTS_FAST_PASSWORD_HASHER') == '1'
+FAST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# permissions are created when the test database is migrated so they stay the same for the whole run
+_permissions = {}
+# password -> hash, the salt is not important for test users so one hash is shared by every user with that password
+_password_hashes = {}
+
+
+def use_fast_password_hasher(test_class):
+    if FAST_PASSWORD_HASHER:
+        return override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)(test_class)
+    return test_class
+
+
+def get_password_hash(password):
+    key = (password, settings.PASSWORD_HASHERS[0])
+    if key not in _password_hashes:
+        _password_hashes[key] = make_password(password)
+    return _password_hashes[key]
+
+
+def get_permission(model, codename):
+    key = (model, codename)
+    if key not in _permissions:
+        content_type = ContentType.objects.get_for_model(model)
+        _permissions[key] = Permission.objects.get(content_type=content_type, codename=codename)
+    return _permissions[key]
+
+
+def add_group(name, permissions=()):
+    # permissions is a list of (model, codename) tuples
+    group = Group.objects.create(name=name)
+    group.permissions.add(*[get_permission(model, codename) for model, codename in permissions])
+    return group
+
+
+def add_user(credentials, groups=()):
+    credentials = dict(credentials)
+    password = credentials.pop('password')
+    user = User.objects.create_user(**credentials)
+    user.password = get_password_hash(password)
+    user.save()
+    if len(groups) > 0:
+        user.groups.add(*groups)
+    return user
+
+
+def add_superuser(credentials):
+    group, created = Group.objects.get_or_create(name='api_tests_superusers')
+    return add_user(credentials, [group])
+
+
+def build_users(target):
+    target.u1 = add_user({'username': 'User1',
+                          'email': 'user1@example.com',
+                          'password': 'secret'})
+    target.u2 = add_user({'username': 'User2',
+                          'email': 'user2@example.com',
+                          'password': 'secret'})
+    target.u3 = add_superuser({'username': 'User3',
+                               'email': 'user3@example.com',
+                               'password': 'secret'})
+    target.u4 = add_user({'username': 'User4',
+                          'email': 'user4@example.com',
+                          'password': 'secret'})
+
+
+def build_editors(target):
+    target.e1 = models.Editor.objects.create(user=target.u1, active=True)
+    target.e2 = models.Editor.objects.create(user=target.u2, active=True)
+    target.e3 = models.Editor.objects.create(user=target.u3, active=True)
+    target.e4 = models.Editor.objects.create(user=target.u4, active=True)
+
+
+def build_authors_and_works(target):
+    target.a1 = models.Author.objects.create(identifier='JS1', name='John Smith', age=28, active=True)
+    target.a2 = models.Author.objects.create(identifier='JS2', name='Jane Smart', age=34, active=True)
+    target.w1 = models.Work.objects.create(identifier='W1', title='My First Book', author=target.a1)
+    target.w2 = models.Work.objects.create(identifier='W2', title='My Second Book', author=target.a1)
+    target.w3 = models.Work.objects.create(identifier='W3', title='My Best Book', author=target.a2)
+    target.w4 = models.Work.objects.create(identifier='W4', title='Another Great Book', author=target.a2)
+
+
+def build_decisions(target):
+    target.d1 = models.Decision.objects.create(work=target.w1, accept=True, summary_notes='accepted for publication',
+                                               public=True, user=target.u4)
+    target.d2 = models.Decision.objects.create(work=target.w2, summary_notes='needs further cosideration',
+                                               public=False, user=target.u4)
+    target.d3 = models.Decision.objects.create(work=target.w3, accept=True, summary_notes='third review requested',
+                                               user=target.u2)
+    target.d4 = models.Decision.objects.create(work=target.w4, accept=False, summary_notes='Not ready yet',
+                                               public=True, user=target.u2)
+
+
+def build_reviews(target):
+    target.r1 = models.Review.objects.create(notes='Good', score=7, work=target.w1, user=target.u1)
+    target.r2 = models.Review.objects.create(notes='Great', score=10, work=target.w1, user=target.u2)
+    target.r3 = models.Review.objects.create(notes='Good', score=6, work=target.w2, user=target.u1)
+    target.r4 = models.Review.objects.create(notes='not great', score=3, work=target.w2, user=target.u3)
+    target.r5 = models.Review.objects.create(notes='okay', score=5, work=target.w2, user=target.u4)
+    target.r6 = models.Review.objects.create(notes='Looking good', score=8, work=target.w3, user=target.u4)
+
+
+def build_projects(target):
+    target.u5 = add_user({'username': 'User5',
+                          'email': 'user5@example.com',
+                          'password': 'secret'})
+    target.p1 = models.Project.objects.create(managing_editor=target.u4, status='in press', genre='sci-fi')
+    target.p1.work.add(target.w1.id)
+    target.p1.editors.add(target.u2.id)
+    target.p2 = models.Project.objects.create(managing_editor=target.u2, status='started', genre='historical')
+    target.p2.work.add(target.w3.id)
+    target.p2.editors.add(target.u1.id, target.u3.id, target.u5.id)
+    target.pp1 = models.PublicationPlan.objects.create(project=target.p1, current_stage='print',
+                                                       notes='print run due next week', public=True, user=target.u1)
+    target.pp2 = models.PublicationPlan.objects.create(project=target.p1, current_stage='review',
+                                                       notes='third review due November', public=False,
+                                                       user=target.u2)
+    target.pp3 = models.PublicationPlan.objects.create(project=target.p2, current_stage='review',
+                                                       notes='third review due December', public=False,
+                                                       user=target.u4)
+
+
+def build_data(target):
+    # users, editors, authors, works, decisions and reviews
+    build_users(target)
+    build_editors(target)
+    build_authors_and_works(target)
+    build_decisions(target)
+    build_reviews(target)
+
+
+@use_fast_password_hasher
+class SharedDataTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        build_data(cls)
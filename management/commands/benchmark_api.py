@@ -0,0 +1,34 @@
+import json
+from django.core.management.base import BaseCommand
+from django.test.utils import setup_test_environment, teardown_test_environment, setup_databases, teardown_databases
+from api_tests.benchmarks import data, runner
+
+
+class Command(BaseCommand):
+    help = 'Times the generic API list and detail views over the api_tests models and writes the results as JSON. ' \
+           'The data is created in a test database which is removed afterwards.'
+
+    def add_arguments(self, parser):
+        for key, value in data.DEFAULT_VOLUMES.items():
+            parser.add_argument('--{}'.format(key.replace('_', '-')), type=int, default=value, dest=key)
+        parser.add_argument('--repeats', type=int, default=20, help='timed calls per scenario')
+        parser.add_argument('--mode', choices=['client', 'view', 'both'], default='both',
+                            help='call through the test client, directly call the view or both')
+        parser.add_argument('--seed', type=int, default=1, help='random seed for the generated data')
+        parser.add_argument('--output', default='-', help='file to write the JSON to (default stdout)')
+
+    def handle(self, *args, **options):
+        volumes = {key: options[key] for key in data.DEFAULT_VOLUMES}
+        modes = ['client', 'view'] if options['mode'] == 'both' else [options['mode']]
+        setup_test_environment()
+        old_config = setup_databases(0, False, aliases={'default'})
+        try:
+            report = runner.run(volumes, options['repeats'], modes, options['seed'])
+        finally:
+            teardown_databases(old_config, 0)
+            teardown_test_environment()
+        if options['output'] == '-':
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            with open(options['output'], 'w') as output_file:
+                json.dump(report, output_file, indent=2)
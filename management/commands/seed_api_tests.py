@@ -0,0 +1,33 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from api_tests import models, seeding
+
+
+class Command(BaseCommand):
+    help = 'Fills the database with generated data for all the api_tests models. ' \
+           'The same options and seed always produce the same data. The api_tests tables must be empty.'
+
+    def add_arguments(self, parser):
+        for key, value in seeding.DEFAULT_VOLUMES.items():
+            parser.add_argument('--{}'.format(key.replace('_', '-')), type=int, default=value, dest=key,
+                                help='default {}'.format(value))
+        parser.add_argument('--seed', type=int, default=1, help='random seed (default 1)')
+        parser.add_argument('--chunk-size', type=int, default=2000, dest='chunk_size',
+                            help='number of authors created at a time and the bulk_create batch size (default 2000)')
+
+    def handle(self, *args, **options):
+        if models.Author.objects.exists() or models.Project.objects.exists():
+            raise CommandError('The api_tests tables already contain data.')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1.')
+        volumes = {key: options[key] for key in seeding.DEFAULT_VOLUMES}
+        start = time.perf_counter()
+
+        def log(message):
+            self.stdout.write('{:.1f}s {}'.format(time.perf_counter() - start, message))
+
+        with transaction.atomic():
+            seeding.seed(volumes, options['seed'], options['chunk_size'], log)
+        message = 'Seeded the api_tests models in {:.1f}s'.format(time.perf_counter() - start)
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_tests', '0013_publicationplan_public'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['user', 'id'], name='at_review_user_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='decision',
+            index=models.Index(fields=['user', 'id'], name='at_decision_user_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='decision',
+            index=models.Index(condition=models.Q(public=True), fields=['id'], name='at_decision_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publicationplan',
+            index=models.Index(fields=['project', 'id'], name='at_publicationplan_proj_idx'),
+        ),
+    ]
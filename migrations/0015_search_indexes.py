@@ -0,0 +1,139 @@
+from django.db import migrations
+
+# Full text search indexes over each model's SEARCH_FIELDS at the time of this migration:
+#     api_tests_author: name, api_tests_work: title, api_tests_review: notes, api_tests_decision: summary_notes
+# On PostgreSQL a GIN index on the tsvector of the fields and on SQLite an FTS5 external content table kept up to
+# date by triggers. Other databases, and SQLite builds without FTS5, get no index.
+# The update triggers only fire when the text changes, Django's save() sets every column so UPDATE OF alone would
+# also rebuild the entry on saves that only change other fields (such as the version and last modified fields).
+# SQLite drops triggers when a migration rebuilds a table so such migrations need to recreate them.
+
+SEARCH_TABLES = {
+    'api_tests_author': ['name'],
+    'api_tests_work': ['title'],
+    'api_tests_review': ['notes'],
+    'api_tests_decision': ['summary_notes'],
+}
+
+CREATE_SQL = {
+    'postgresql': [
+        'CREATE INDEX "api_tests_author_search_idx" ON "api_tests_author" '
+        'USING gin ((to_tsvector(\'english\', coalesce("name", \'\'))))',
+        'CREATE INDEX "api_tests_work_search_idx" ON "api_tests_work" '
+        'USING gin ((to_tsvector(\'english\', coalesce("title", \'\'))))',
+        'CREATE INDEX "api_tests_review_search_idx" ON "api_tests_review" '
+        'USING gin ((to_tsvector(\'english\', coalesce("notes", \'\'))))',
+        'CREATE INDEX "api_tests_decision_search_idx" ON "api_tests_decision" '
+        'USING gin ((to_tsvector(\'english\', coalesce("summary_notes", \'\'))))',
+    ],
+    'sqlite': [
+        # author
+        "CREATE VIRTUAL TABLE api_tests_author_fts USING fts5(name, content='api_tests_author', "
+        "content_rowid='id', tokenize='porter unicode61')",
+        'CREATE TRIGGER api_tests_author_fts_ai AFTER INSERT ON api_tests_author BEGIN '
+        'INSERT INTO api_tests_author_fts(rowid, name) VALUES (new.id, new.name); END',
+        'CREATE TRIGGER api_tests_author_fts_ad AFTER DELETE ON api_tests_author BEGIN '
+        "INSERT INTO api_tests_author_fts(api_tests_author_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+        'CREATE TRIGGER api_tests_author_fts_au AFTER UPDATE OF name ON api_tests_author '
+        'WHEN old.name IS NOT new.name BEGIN '
+        "INSERT INTO api_tests_author_fts(api_tests_author_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+        'INSERT INTO api_tests_author_fts(rowid, name) VALUES (new.id, new.name); END',
+        "INSERT INTO api_tests_author_fts(api_tests_author_fts) VALUES ('rebuild')",
+        # work
+        "CREATE VIRTUAL TABLE api_tests_work_fts USING fts5(title, content='api_tests_work', "
+        "content_rowid='id', tokenize='porter unicode61')",
+        'CREATE TRIGGER api_tests_work_fts_ai AFTER INSERT ON api_tests_work BEGIN '
+        'INSERT INTO api_tests_work_fts(rowid, title) VALUES (new.id, new.title); END',
+        'CREATE TRIGGER api_tests_work_fts_ad AFTER DELETE ON api_tests_work BEGIN '
+        "INSERT INTO api_tests_work_fts(api_tests_work_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+        'CREATE TRIGGER api_tests_work_fts_au AFTER UPDATE OF title ON api_tests_work '
+        'WHEN old.title IS NOT new.title BEGIN '
+        "INSERT INTO api_tests_work_fts(api_tests_work_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+        'INSERT INTO api_tests_work_fts(rowid, title) VALUES (new.id, new.title); END',
+        "INSERT INTO api_tests_work_fts(api_tests_work_fts) VALUES ('rebuild')",
+        # review
+        "CREATE VIRTUAL TABLE api_tests_review_fts USING fts5(notes, content='api_tests_review', "
+        "content_rowid='id', tokenize='porter unicode61')",
+        'CREATE TRIGGER api_tests_review_fts_ai AFTER INSERT ON api_tests_review BEGIN '
+        'INSERT INTO api_tests_review_fts(rowid, notes) VALUES (new.id, new.notes); END',
+        'CREATE TRIGGER api_tests_review_fts_ad AFTER DELETE ON api_tests_review BEGIN '
+        'INSERT INTO api_tests_review_fts(api_tests_review_fts, rowid, notes) '
+        "VALUES ('delete', old.id, old.notes); END",
+        'CREATE TRIGGER api_tests_review_fts_au AFTER UPDATE OF notes ON api_tests_review '
+        'WHEN old.notes IS NOT new.notes BEGIN '
+        "INSERT INTO api_tests_review_fts(api_tests_review_fts, rowid, notes) VALUES ('delete', old.id, old.notes); "
+        'INSERT INTO api_tests_review_fts(rowid, notes) VALUES (new.id, new.notes); END',
+        "INSERT INTO api_tests_review_fts(api_tests_review_fts) VALUES ('rebuild')",
+        # decision
+        "CREATE VIRTUAL TABLE api_tests_decision_fts USING fts5(summary_notes, content='api_tests_decision', "
+        "content_rowid='id', tokenize='porter unicode61')",
+        'CREATE TRIGGER api_tests_decision_fts_ai AFTER INSERT ON api_tests_decision BEGIN '
+        'INSERT INTO api_tests_decision_fts(rowid, summary_notes) VALUES (new.id, new.summary_notes); END',
+        'CREATE TRIGGER api_tests_decision_fts_ad AFTER DELETE ON api_tests_decision BEGIN '
+        'INSERT INTO api_tests_decision_fts(api_tests_decision_fts, rowid, summary_notes) '
+        "VALUES ('delete', old.id, old.summary_notes); END",
+        'CREATE TRIGGER api_tests_decision_fts_au AFTER UPDATE OF summary_notes ON api_tests_decision '
+        'WHEN old.summary_notes IS NOT new.summary_notes BEGIN '
+        'INSERT INTO api_tests_decision_fts(api_tests_decision_fts, rowid, summary_notes) '
+        "VALUES ('delete', old.id, old.summary_notes); "
+        'INSERT INTO api_tests_decision_fts(rowid, summary_notes) VALUES (new.id, new.summary_notes); END',
+        "INSERT INTO api_tests_decision_fts(api_tests_decision_fts) VALUES ('rebuild')",
+    ],
+}
+
+DROP_SQL = {
+    'postgresql': [
+        'DROP INDEX IF EXISTS "api_tests_author_search_idx"',
+        'DROP INDEX IF EXISTS "api_tests_work_search_idx"',
+        'DROP INDEX IF EXISTS "api_tests_review_search_idx"',
+        'DROP INDEX IF EXISTS "api_tests_decision_search_idx"',
+    ],
+    'sqlite': [
+        'DROP TRIGGER IF EXISTS api_tests_author_fts_ai',
+        'DROP TRIGGER IF EXISTS api_tests_author_fts_ad',
+        'DROP TRIGGER IF EXISTS api_tests_author_fts_au',
+        'DROP TABLE IF EXISTS api_tests_author_fts',
+        'DROP TRIGGER IF EXISTS api_tests_work_fts_ai',
+        'DROP TRIGGER IF EXISTS api_tests_work_fts_ad',
+        'DROP TRIGGER IF EXISTS api_tests_work_fts_au',
+        'DROP TABLE IF EXISTS api_tests_work_fts',
+        'DROP TRIGGER IF EXISTS api_tests_review_fts_ai',
+        'DROP TRIGGER IF EXISTS api_tests_review_fts_ad',
+        'DROP TRIGGER IF EXISTS api_tests_review_fts_au',
+        'DROP TABLE IF EXISTS api_tests_review_fts',
+        'DROP TRIGGER IF EXISTS api_tests_decision_fts_ai',
+        'DROP TRIGGER IF EXISTS api_tests_decision_fts_ad',
+        'DROP TRIGGER IF EXISTS api_tests_decision_fts_au',
+        'DROP TABLE IF EXISTS api_tests_decision_fts',
+    ],
+}
+
+
+def has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return 'ENABLE_FTS5' in [row[0] for row in cursor.fetchall()]
+
+
+def create_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite' and not has_fts5(connection):
+        return
+    for sql in CREATE_SQL.get(connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_indexes(apps, schema_editor):
+    for sql in DROP_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_tests', '0014_availability_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,54 @@
+from django.db import migrations
+
+# Indexes for the wildcard filters on each model's TRIGRAM_FIELDS at the time of this migration (PostgreSQL only):
+#     api_tests_author: name, api_tests_work: title
+# Django compares case insensitive lookups (icontains, istartswith, iexact...) as UPPER(field) LIKE/= UPPER(value)
+# on PostgreSQL so the expression indexes are on UPPER(field) to match the SQL that is generated.
+# For each field:
+#     _trgm covers *Test*, Test* and *Test
+#     _utrgm covers *Test*|i, Test*|i and *Test|i
+#     _upper covers Test|i
+# On other databases nothing is done and the lookups work as before without the indexes.
+
+CREATE_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX "api_tests_author_name_trgm" ON "api_tests_author" USING gin ("name" gin_trgm_ops)',
+    'CREATE INDEX "api_tests_author_name_utrgm" ON "api_tests_author" USING gin ((UPPER("name")) gin_trgm_ops)',
+    'CREATE INDEX "api_tests_author_name_upper" ON "api_tests_author" ((UPPER("name")) text_pattern_ops)',
+    'CREATE INDEX "api_tests_work_title_trgm" ON "api_tests_work" USING gin ("title" gin_trgm_ops)',
+    'CREATE INDEX "api_tests_work_title_utrgm" ON "api_tests_work" USING gin ((UPPER("title")) gin_trgm_ops)',
+    'CREATE INDEX "api_tests_work_title_upper" ON "api_tests_work" ((UPPER("title")) text_pattern_ops)',
+]
+
+# the extension is left in place as other tables may be using it
+DROP_SQL = [
+    'DROP INDEX IF EXISTS "api_tests_author_name_trgm"',
+    'DROP INDEX IF EXISTS "api_tests_author_name_utrgm"',
+    'DROP INDEX IF EXISTS "api_tests_author_name_upper"',
+    'DROP INDEX IF EXISTS "api_tests_work_title_trgm"',
+    'DROP INDEX IF EXISTS "api_tests_work_title_utrgm"',
+    'DROP INDEX IF EXISTS "api_tests_work_title_upper"',
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in CREATE_SQL:
+            schema_editor.execute(sql)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in DROP_SQL:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_tests', '0015_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
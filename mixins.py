@@ -0,0 +1,38 @@
+from django.db import models
+from django.db.models import Q
+
+# Abstract models adding the indexes each AVAILABILITY mode filters on.
+# List the mixin before BaseModel so the model inherits its Meta, for example:
+#     class Review (UserAvailabilityIndexes, BaseModel):
+# Index names use %(class)s so each must stay within 30 characters once the model name is added.
+
+
+class UserAvailabilityIndexes(models.Model):
+    # 'private' - rows are restricted to the requesting user and paged by id
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=['user', 'id'], name='at_%(class)s_user_id_idx'),
+        ]
+
+
+class PublicOrUserAvailabilityIndexes(models.Model):
+    # 'public_or_user' - anonymous users only see public rows, logged in users also see their own
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=['user', 'id'], name='at_%(class)s_user_id_idx'),
+            models.Index(fields=['id'], name='at_%(class)s_public_idx', condition=Q(public=True)),
+        ]
+
+
+class ProjectAvailabilityIndexes(models.Model):
+    # 'project' - rows are restricted to the requested project
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=['project', 'id'], name='at_%(class)s_proj_idx'),
+        ]
@@ -1,16 +1,23 @@
 from django.db import models
 from django.conf import settings
 from api.models import BaseModel
+from . import registry
+from .availability import Availability
+from .mixins import UserAvailabilityIndexes, PublicOrUserAvailabilityIndexes, ProjectAvailabilityIndexes
 
 
 class Author (BaseModel):
 
-    AVAILABILITY = 'public'
+    AVAILABILITY = Availability('public')
 
     REQUIRED_FIELDS = ['identifier', 'name']
 
     SERIALIZER = 'AuthorSerializer'
 
+    SEARCH_FIELDS = ['name']
+
+    TRIGRAM_FIELDS = ['name']
+
     identifier = models.TextField('Identifier', unique=True)
     name = models.TextField('Name', blank=True)
     age = models.IntegerField('Age', null=True, blank=True)
@@ -18,11 +25,7 @@ class Author (BaseModel):
     active = models.BooleanField('Active', null=True)
 
     def get_fields():
-        data = {}
-        fields = list(Author._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Author)
 
     class Meta:
         ordering = ['identifier']
@@ -30,47 +33,47 @@ class Author (BaseModel):
 
 class Work (BaseModel):
 
-    AVAILABILITY = 'public'
+    AVAILABILITY = Availability('public')
 
     SERIALIZER = 'WorkSerializer'
 
+    SEARCH_FIELDS = ['title']
+
+    TRIGRAM_FIELDS = ['title']
+
     identifier = models.TextField('Identifier', blank=True)
     title = models.TextField('Title', blank=True)
     author = models.ForeignKey('Author', models.PROTECT, related_name='works')
 
     def get_fields():
-        data = {}
-        fields = list(Work._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Work)
 
 
-class Review (BaseModel):
+class Review (UserAvailabilityIndexes, BaseModel):
 
-    AVAILABILITY = 'private'
+    AVAILABILITY = Availability('private')
 
     SERIALIZER = 'ReviewSerializer'
 
+    SEARCH_FIELDS = ['notes']
+
     notes = models.TextField('Notes', null=True, blank=True)
     score = models.IntegerField('Score', null=True, blank=True)
     work = models.ForeignKey('Work', models.PROTECT, related_name='reviews')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, models.PROTECT, related_name='reviewers')
 
     def get_fields():
-        data = {}
-        fields = list(Review._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Review)
 
 
-class Decision (BaseModel):
+class Decision (PublicOrUserAvailabilityIndexes, BaseModel):
 
-    AVAILABILITY = 'public_or_user'
+    AVAILABILITY = Availability('public_or_user')
 
     SERIALIZER = 'DecisionSerializer'
 
+    SEARCH_FIELDS = ['summary_notes']
+
     work = models.ForeignKey('Work', models.PROTECT, related_name='decision')
     accept = models.BooleanField(null=True)
     summary_notes = models.TextField('Notes', null=True, blank=True)
@@ -78,16 +81,12 @@ class Decision (BaseModel):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, models.PROTECT, related_name='decider')
 
     def get_fields():
-        data = {}
-        fields = list(Decision._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Decision)
 
 
 class Project (BaseModel):
 
-    AVAILABILITY = 'public'
+    AVAILABILITY = Availability('public')
 
     managing_editor = models.ForeignKey(settings.AUTH_USER_MODEL, models.PROTECT, related_name='manager')
     editors = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='editor_of', blank=True)
@@ -96,25 +95,20 @@ class Project (BaseModel):
     work = models.ManyToManyField('Work', related_name='included_in', blank=True)
 
     def get_fields():
-        data = {}
-        fields = list(Decision._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Project)
 
     def get_user_fields():
         user_fields = ['editors', 'managing_editor']
         data = {}
-        fields = list(Project._meta.get_fields(include_hidden=True))
-        for field in fields:
-            if field.name in user_fields:
-                data[field.name] = field.get_internal_type()
+        for field_name, field_type in registry.get_field_types(Project).items():
+            if field_name in user_fields:
+                data[field_name] = field_type
         return data
 
 
-class PublicationPlan (BaseModel):
+class PublicationPlan (ProjectAvailabilityIndexes, BaseModel):
 
-    AVAILABILITY = 'project'
+    AVAILABILITY = Availability('project')
 
     SERIALIZER = 'PublicationPlanSerializer'
 
@@ -126,16 +120,12 @@ class PublicationPlan (BaseModel):
     editors = models.ManyToManyField('Editor', blank=True)
 
     def get_fields():
-        data = {}
-        fields = list(PublicationPlan._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(PublicationPlan)
 
 
 class Editor (BaseModel):
 
-    AVAILABILITY = 'logged_in'
+    AVAILABILITY = Availability('logged_in')
 
     SERIALIZER = 'EditorSerializer'
 
@@ -143,11 +133,7 @@ class Editor (BaseModel):
     active = models.BooleanField(null=True)
 
     def get_fields():
-        data = {}
-        fields = list(Editor._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Editor)
 
 
 class Edition (BaseModel):
@@ -161,8 +147,4 @@ class Edition (BaseModel):
     volume = models.TextField('Volume', blank=True)
 
     def get_fields():
-        data = {}
-        fields = list(Edition._meta.get_fields(include_hidden=True))
-        for field in fields:
-            data[field.name] = field.get_internal_type()
-        return data
+        return registry.get_field_types(Edition)
@@ -0,0 +1,30 @@
+# model class -> {field name: internal type}, populated by build() from ApitestsConfig.ready()
+_field_types = {}
+
+
+def build(app_config):
+    for model in app_config.get_models():
+        _field_types[model] = _read_field_types(model)
+
+
+def _read_field_types(model):
+    data = {}
+    fields = list(model._meta.get_fields(include_hidden=True))
+    for field in fields:
+        data[field.name] = field.get_internal_type()
+    return data
+
+
+def get_field_types(model):
+    # models outside the registry (or added after ready()) are read on first use and then kept
+    if model not in _field_types:
+        _field_types[model] = _read_field_types(model)
+    # return a copy so callers cannot change the registry
+    return dict(_field_types[model])
+
+
+def clear_cache(app_config=None):
+    # for tests that patch models, if app_config is supplied the registry is rebuilt straight away
+    _field_types.clear()
+    if app_config is not None:
+        build(app_config)
@@ -0,0 +1,175 @@
+import datetime
+import random
+from itertools import islice
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from . import models
+
+# Generates referentially consistent data for all the api_tests models using bulk_create.
+# The same volumes and random seed always produce the same data.
+# Authors and everything that hangs off them are created a chunk of authors at a time so memory use stays flat.
+
+User = get_user_model()
+
+DEFAULT_VOLUMES = {'users': 100,
+                   'authors': 1000,
+                   'works_per_author': 3,
+                   'editions_per_work': 2,
+                   'reviews_per_work': 3,
+                   'projects': 50,
+                   'editors_per_project': 3,
+                   'works_per_project': 5,
+                   'plans_per_project': 5,
+                   'editors_per_plan': 2}
+
+PASSWORD = 'secret'
+USERNAME = 'seed_user{}'
+AUTHOR_IDENTIFIER = 'A{:08d}'
+PUBLIC_FRACTION = 0.5
+
+FIRST_NAMES = ['John', 'Jane', 'Anna', 'Mark', 'Sarah', 'David', 'Emily', 'James', 'Laura', 'Peter']
+LAST_NAMES = ['Smith', 'Smart', 'Stopes', 'Jones', 'Brown', 'Taylor', 'Wilson', 'Evans', 'Walker', 'Hughes']
+TITLE_WORDS = ['First', 'Second', 'Best', 'Great', 'Lost', 'Last', 'Silent', 'Hidden', 'Long', 'Book', 'Story',
+               'Journey', 'House', 'River', 'Night']
+NOTES = ['Good', 'Great', 'not great', 'okay', 'Looking good', 'needs further consideration',
+         'accepted for publication', 'third review requested', 'Not ready yet']
+PLACES = ['London', 'Birmingham', 'Oxford', 'New York', 'Berlin']
+STAGES = ['review', 'copy edit', 'typesetting', 'print']
+STATUSES = ['started', 'in press', 'published']
+GENRES = ['sci-fi', 'historical', 'crime', 'poetry', 'biography']
+
+
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def seed(volumes=None, random_seed=1, chunk_size=2000, log=None):
+    # expects the api_tests tables to be empty, log is called with a progress message after each stage
+    config = dict(DEFAULT_VOLUMES)
+    if volumes is not None:
+        config.update(volumes)
+    rng = random.Random(random_seed)
+
+    def report(message):
+        if log is not None:
+            log(message)
+
+    user_ids = seed_users(config, chunk_size)
+    report('{} users and editors'.format(len(user_ids)))
+    editor_ids = list(models.Editor.objects.filter(user_id__in=user_ids).order_by('id').values_list('id', flat=True))
+
+    created = 0
+    for author_numbers in chunks(range(config['authors']), chunk_size):
+        seed_authors(config, rng, author_numbers, user_ids, chunk_size)
+        created += len(author_numbers)
+        report('{} authors with their works, editions, reviews and decisions'.format(created))
+
+    seed_projects(config, rng, user_ids, editor_ids, chunk_size)
+    report('{} projects with their publication plans'.format(config['projects']))
+    return config
+
+
+def seed_users(config, chunk_size):
+    # the password is hashed once and shared, the first user is a superuser (see MyAPITestCase.add_superuser)
+    password = make_password(PASSWORD)
+    usernames = [USERNAME.format(i) for i in range(config['users'])]
+    User.objects.bulk_create([User(username=username, email='{}@example.com'.format(username), password=password)
+                              for username in usernames], batch_size=chunk_size)
+    user_ids = list(User.objects.filter(username__in=usernames).order_by('id').values_list('id', flat=True))
+    if len(user_ids) > 0:
+        superusers, created = Group.objects.get_or_create(name='api_tests_superusers')
+        superusers.user_set.add(user_ids[0])
+    models.Editor.objects.bulk_create([models.Editor(user_id=user_id, active=True) for user_id in user_ids],
+                                      batch_size=chunk_size)
+    return user_ids
+
+
+def seed_authors(config, rng, author_numbers, user_ids, chunk_size):
+    start_date = datetime.date(1950, 1, 1)
+    identifiers = [AUTHOR_IDENTIFIER.format(i) for i in author_numbers]
+    models.Author.objects.bulk_create([
+        models.Author(identifier=identifier,
+                      name='{} {}'.format(rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)),
+                      age=rng.randint(18, 90),
+                      date_joined=start_date + datetime.timedelta(days=rng.randint(0, 25000)),
+                      active=rng.random() < 0.9) for identifier in identifiers], batch_size=chunk_size)
+    author_ids = dict(models.Author.objects.filter(identifier__in=identifiers).values_list('identifier', 'id'))
+
+    works = []
+    for identifier in identifiers:
+        for i in range(config['works_per_author']):
+            works.append(models.Work(identifier='W{}-{}'.format(identifier[1:], i),
+                                     title=' '.join(rng.sample(TITLE_WORDS, 3)),
+                                     author_id=author_ids[identifier]))
+    models.Work.objects.bulk_create(works, batch_size=chunk_size)
+    work_ids = list(models.Work.objects.filter(author_id__in=author_ids.values()).order_by('id')
+                    .values_list('id', flat=True))
+
+    models.Edition.objects.bulk_create([
+        models.Edition(identifier='E{}-{}'.format(work_id, i), work_id=work_id, year=rng.randint(1900, 2020),
+                       place=rng.choice(PLACES), volume=str(i + 1))
+        for work_id in work_ids for i in range(config['editions_per_work'])], batch_size=chunk_size)
+    if len(user_ids) == 0:
+        return
+    models.Review.objects.bulk_create([
+        models.Review(notes=rng.choice(NOTES), score=rng.randint(0, 10), work_id=work_id,
+                      user_id=rng.choice(user_ids))
+        for work_id in work_ids for i in range(config['reviews_per_work'])], batch_size=chunk_size)
+    models.Decision.objects.bulk_create([
+        models.Decision(work_id=work_id, accept=rng.choice([True, False, None]), summary_notes=rng.choice(NOTES),
+                        public=choose_public(rng), user_id=rng.choice(user_ids))
+        for work_id in work_ids], batch_size=chunk_size)
+
+
+def choose_public(rng):
+    # a mix of public, private and unrecorded decisions (see d3 in the test data)
+    if rng.random() < 0.1:
+        return None
+    return rng.random() < PUBLIC_FRACTION
+
+
+def seed_projects(config, rng, user_ids, editor_ids, chunk_size):
+    if len(user_ids) == 0 or config['projects'] == 0:
+        return
+    existing_project_ids = set(models.Project.objects.values_list('id', flat=True))
+    models.Project.objects.bulk_create([
+        models.Project(managing_editor_id=rng.choice(user_ids), status=rng.choice(STATUSES),
+                       genre=rng.choice(GENRES)) for i in range(config['projects'])], batch_size=chunk_size)
+    project_ids = sorted(set(models.Project.objects.values_list('id', flat=True)) - existing_project_ids)
+
+    work_range = models.Work.objects.order_by('id').values_list('id', flat=True)
+    first_work_id, last_work_id = work_range.first(), work_range.last()
+    project_editors = []
+    project_works = []
+    for project_id in project_ids:
+        for user_id in rng.sample(user_ids, min(config['editors_per_project'], len(user_ids))):
+            project_editors.append(models.Project.editors.through(project_id=project_id, user_id=user_id))
+        if first_work_id is not None:
+            for work_id in set(rng.randint(first_work_id, last_work_id) for i in range(config['works_per_project'])):
+                project_works.append(models.Project.work.through(project_id=project_id, work_id=work_id))
+    models.Project.editors.through.objects.bulk_create(project_editors, batch_size=chunk_size)
+    for project_works_chunk in chunks(project_works, chunk_size):
+        # ids are normally contiguous but drop any that fall in a gap
+        existing_work_ids = set(models.Work.objects.filter(id__in=[item.work_id for item in project_works_chunk])
+                                .values_list('id', flat=True))
+        models.Project.work.through.objects.bulk_create([item for item in project_works_chunk
+                                                         if item.work_id in existing_work_ids])
+
+    projects_per_chunk = max(chunk_size // max(config['plans_per_project'], 1), 1)
+    for project_chunk in chunks(project_ids, projects_per_chunk):
+        models.PublicationPlan.objects.bulk_create([
+            models.PublicationPlan(project_id=project_id, current_stage=rng.choice(STAGES), notes=rng.choice(NOTES),
+                                   public=rng.random() < PUBLIC_FRACTION, user_id=rng.choice(user_ids))
+            for project_id in project_chunk for i in range(config['plans_per_project'])], batch_size=chunk_size)
+        plan_editors = []
+        for plan_id in models.PublicationPlan.objects.filter(project_id__in=project_chunk).order_by('id') \
+                .values_list('id', flat=True):
+            for editor_id in rng.sample(editor_ids, min(config['editors_per_plan'], len(editor_ids))):
+                plan_editors.append(models.PublicationPlan.editors.through(publicationplan_id=plan_id,
+                                                                           editor_id=editor_id))
+        models.PublicationPlan.editors.through.objects.bulk_create(plan_editors, batch_size=chunk_size)
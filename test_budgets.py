@@ -0,0 +1,74 @@
+import json
+import os
+from django.test import TestCase
+from api_tests.benchmarks import data, runner, scenarios
+
+# The query count of each scenario is compared against the baseline in budgets.json and a scenario fails if it runs
+# more queries than its baseline. Until a baseline has been recorded the test is skipped, after that a scenario with
+# no baseline (for example a new model) fails. Latency is only checked when API_TESTS_CHECK_LATENCY=1 is set, as wall
+# clock timings are not reliable on shared machines. A scenario then fails if its median latency is outside the
+# envelope (baseline * latency_factor + latency_slack_ms).
+# To regenerate the baseline after an intended change run the tests with API_TESTS_UPDATE_BUDGETS=1 set, e.g.
+#     API_TESTS_UPDATE_BUDGETS=1 python manage.py test api_tests.test_budgets
+
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'budgets.json')
+UPDATE_BUDGETS = os.environ.get('API_TESTS_UPDATE_BUDGETS') == '1'
+CHECK_LATENCY = os.environ.get('API_TESTS_CHECK_LATENCY') == '1'
+
+# enough rows that a per row query shows up in the count
+VOLUMES = {'users': 6,
+           'authors': 12,
+           'works_per_author': 2,
+           'editions_per_work': 2,
+           'reviews_per_work': 2,
+           'projects': 3,
+           'editors_per_project': 2,
+           'works_per_project': 2,
+           'plans_per_project': 4,
+           'editors_per_plan': 2}
+# the query count is the same on every call so one call is enough unless the latency is needed
+REPEATS = 30 if UPDATE_BUDGETS or CHECK_LATENCY else 1
+
+
+class APIBudgetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixtures = data.seed(VOLUMES)
+
+    def test_endpoints_within_budget(self):
+        with open(BUDGET_FILE) as budget_file:
+            budgets = json.load(budget_file)
+        envelope = budgets['envelope']
+        if not UPDATE_BUDGETS and len(budgets['scenarios']) == 0:
+            # the baseline has to be recorded in a project with the api app installed before this test can check it
+            self.skipTest('budgets.json has no baseline yet, run the tests with API_TESTS_UPDATE_BUDGETS=1 to '
+                          'record one')
+        users = runner.get_users(self.fixtures)
+        recorded = {}
+        for scenario in scenarios.get_budget_scenarios(self.fixtures):
+            result = runner.time_scenario(runner.call_client(scenario, users[scenario['user']]), REPEATS)
+            if UPDATE_BUDGETS:
+                recorded[scenario['name']] = {'url': runner.get_url(scenario),
+                                              'status': result['status'],
+                                              'queries': result['queries'],
+                                              'p50_ms': result['p50_ms']}
+                continue
+            with self.subTest(scenario['name']):
+                budget = budgets['scenarios'].get(scenario['name'])
+                if budget is None:
+                    self.fail('{} has no budget in budgets.json, run the tests with API_TESTS_UPDATE_BUDGETS=1 to '
+                              'record one'.format(scenario['name']))
+                message = '{} ran {} queries, the budget is {}'
+                self.assertLessEqual(result['queries'], budget['queries'],
+                                     message.format(scenario['name'], result['queries'], budget['queries']))
+                if CHECK_LATENCY:
+                    allowed = budget['p50_ms'] * envelope['latency_factor'] + envelope['latency_slack_ms']
+                    message = '{} took {}ms, the budget is {}ms'
+                    self.assertLessEqual(result['p50_ms'], allowed,
+                                         message.format(scenario['name'], result['p50_ms'], round(allowed, 3)))
+        if UPDATE_BUDGETS:
+            budgets['scenarios'] = recorded
+            with open(BUDGET_FILE, 'w') as budget_file:
+                json.dump(budgets, budget_file, indent=2, sort_keys=True)
+                budget_file.write('\n')
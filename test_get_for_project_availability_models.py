@@ -1,217 +1,24 @@
 import json
-from django.test import TestCase
-from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Group
 from rest_framework.test import APIClient
-from api_tests import models
-
-User = get_user_model()
-
-
-class MyAPITestCase(TestCase):
-
-    def add_user(self, credentials):
-        user = User.objects.create_user(**credentials)
-        user.save()
-        return user
-
-    def add_superuser(self, credentials):
-        g1 = Group(name='api_tests_superusers')
-        g1.save()
-        user = User.objects.create_user(**credentials)
-        user.groups.add(g1)
-        user.save()
-        return user
-
-    def add_data(self):
-
-        # add users
-        self.u1 = self.add_user({'username': 'User1',
-                                 'email': 'user1@example.com',
-                                 'password': 'secret'})
-        self.u2 = self.add_user({'username': 'User2',
-                                 'email': 'user2@example.com',
-                                 'password': 'secret'})
-        self.u3 = self.add_superuser({'username': 'User3',
-                                      'email': 'user3@example.com',
-                                      'password': 'secret'})
-        self.u4 = self.add_user({'username': 'User4',
-                                 'email': 'user4@example.com',
-                                 'password': 'secret'})
-        self.u5 = self.add_user({'username': 'User5',
-                                 'email': 'user5@example.com',
-                                 'password': 'secret'})
-        e1_data = {'user': self.u1,
-                   'active': True}
-        self.e1 = models.Editor.objects.create(**e1_data)
-        e2_data = {'user': self.u2,
-                   'active': True}
-        self.e2 = models.Editor.objects.create(**e2_data)
-        e3_data = {'user': self.u3,
-                   'active': True}
-        self.e3 = models.Editor.objects.create(**e3_data)
-        e4_data = {'user': self.u4,
-                   'active': True}
-        self.e4 = models.Editor.objects.create(**e4_data)
-
-        a1_data = {'identifier': 'JS1',
-                   'name': 'John Smith',
-                   'age': 28,
-                   'active': True
-                   }
-        self.a1 = models.Author.objects.create(**a1_data)
-        a2_data = {'identifier': 'JS2',
-                   'name': 'Jane Smart',
-                   'age': 34,
-                   'active': True
-                   }
-        self.a2 = models.Author.objects.create(**a2_data)
-
-        w1_data = {'identifier': 'W1',
-                   'title': 'My First Book',
-                   'author': self.a1
-                   }
-        self.w1 = models.Work.objects.create(**w1_data)
-
-        w2_data = {'identifier': 'W2',
-                   'title': 'My Second Book',
-                   'author': self.a1
-                   }
-        self.w2 = models.Work.objects.create(**w2_data)
-
-        w3_data = {'identifier': 'W3',
-                   'title': 'My Best Book',
-                   'author': self.a2
-                   }
-        self.w3 = models.Work.objects.create(**w3_data)
-
-        w4_data = {'identifier': 'W4',
-                   'title': 'Another Great Book',
-                   'author': self.a2
-                   }
-        self.w4 = models.Work.objects.create(**w4_data)
-
-        d1_data = {'work': self.w1,
-                   'accept': True,
-                   'summary_notes': 'accepted for publication',
-                   'public': True,
-                   'user': self.u4}
-        self.d1 = models.Decision.objects.create(**d1_data)
-
-        d2_data = {'work': self.w2,
-                   'summary_notes': 'needs further cosideration',
-                   'public': False,
-                   'user': self.u4}
-        self.d2 = models.Decision.objects.create(**d2_data)
-
-        d3_data = {'work': self.w3,
-                   'accept': True,
-                   'summary_notes': 'third review requested',
-                   'user': self.u2}
-        self.d3 = models.Decision.objects.create(**d3_data)
-
-        d4_data = {'work': self.w4,
-                   'accept': False,
-                   'summary_notes': 'Not ready yet',
-                   'public': True,
-                   'user': self.u2}
-        self.d4 = models.Decision.objects.create(**d4_data)
-
-        r1_data = {'notes': 'Good',
-                   'score': 7,
-                   'work': self.w1,
-                   'user': self.u1
-                   }
-        self.r1 = models.Review.objects.create(**r1_data)
-
-        r2_data = {'notes': 'Great',
-                   'score': 10,
-                   'work': self.w1,
-                   'user': self.u2
-                   }
-        self.r2 = models.Review.objects.create(**r2_data)
-
-        r3_data = {'notes': 'Good',
-                   'score': 6,
-                   'work': self.w2,
-                   'user': self.u1
-                   }
-        self.r3 = models.Review.objects.create(**r3_data)
-
-        r4_data = {'notes': 'not great',
-                   'score': 3,
-                   'work': self.w2,
-                   'user': self.u3
-                   }
-        self.r4 = models.Review.objects.create(**r4_data)
-
-        r5_data = {'notes': 'okay',
-                   'score': 5,
-                   'work': self.w2,
-                   'user': self.u4
-                   }
-        self.r5 = models.Review.objects.create(**r5_data)
-
-        r6_data = {'notes': 'Looking good',
-                   'score': 8,
-                   'work': self.w3,
-                   'user': self.u4
-                   }
-        self.r6 = models.Review.objects.create(**r6_data)
-
-        p1_data = {'managing_editor': self.u4,
-                   'status': 'in press',
-                   'genre': 'sci-fi'}
-        self.p1 = models.Project.objects.create(**p1_data)
-        self.p1.work.add(self.w1.id)
-        self.p1.editors.add(self.u2.id)
-        self.p1.save()
-
-        p2_data = {'managing_editor': self.u2,
-                   'status': 'started',
-                   'genre': 'historical'}
-        self.p2 = models.Project.objects.create(**p2_data)
-        self.p2.work.add(self.w3.id)
-        self.p2.editors.add(self.u1.id)
-        self.p2.editors.add(self.u3.id)
-        self.p2.editors.add(self.u5.id)
-        self.p2.save()
-
-        pp1_data = {'project': self.p1,
-                    'current_stage': 'print',
-                    'notes': 'print run due next week',
-                    'public': True,
-                    'user': self.u1}
-        self.pp1 = models.PublicationPlan.objects.create(**pp1_data)
-
-        pp2_data = {'project': self.p1,
-                    'current_stage': 'review',
-                    'notes': 'third review due November',
-                    'public': False,
-                    'user': self.u2}
-        self.pp2 = models.PublicationPlan.objects.create(**pp2_data)
-
-        pp3_data = {'project': self.p2,
-                    'current_stage': 'review',
-                    'notes': 'third review due December',
-                    'public': False,
-                    'user': self.u4}
-        self.pp3 = models.PublicationPlan.objects.create(**pp3_data)
+from api_tests.availability import override_availability
+from api_tests import models, fixtures
 
 
+class MyAPITestCase(fixtures.SharedDataTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        fixtures.build_projects(cls)
+
+
+@override_availability(models.Author, 'project')
 class APIItemListTestsProjectsBadConfiguration(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
     # manipulating a model to get this situation
 
-    def setUp(self):
-        models.Author.AVAILABILITY = 'project'
-
-    def tearDown(self):
-        models.Author.AVAILABILITY = 'public'
-
     def test_error_returned_if_model_availability_project_and_no_project_flag(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user2@example.com', password='secret')
         self.assertEqual(login, True)
@@ -222,19 +29,13 @@ class APIItemListTestsProjectsBadConfiguration(MyAPITestCase):
                          'Internal server error - model configuation incompatible with API (code 10003)')
 
 
+@override_availability(models.Author, 'project')
 class APIItemListDetailProjectsBadConfiguration(MyAPITestCase):
     base_url = '/api/{}/{}/{}'
 
     # manipulating a model to get this situation
 
-    def setUp(self):
-        models.Author.AVAILABILITY = 'project'
-
-    def tearDown(self):
-        models.Author.AVAILABILITY = 'public'
-
     def test_error_returned_if_model_availability_project_and_no_project_flag(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user2@example.com', password='secret')
         self.assertEqual(login, True)
@@ -248,9 +49,6 @@ class APIItemListDetailProjectsBadConfiguration(MyAPITestCase):
 class APIItemListTestsProjectModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
-    def setUp(self):
-        self.add_data()
-
     def test_get_project_list_returns_401_for_anonymous_user(self):
         response = self.client.get(self.base_url.format('api_tests', 'publicationplan'))
         self.assertEqual(response.status_code, 401)
@@ -314,18 +112,12 @@ class APIItemListTestsProjectModels(MyAPITestCase):
         self.assertEqual(len(response_json['results']), 2)
 
 
+@override_availability(models.Author, 'project_or_user')
 class APIItemListTestsProjectOrUserBadConfiguration(MyAPITestCase):
     base_url = '/api/{}/{}/'
     # manipulate a model to create this situation
 
-    def setUp(self):
-        models.Author.AVAILABILITY = 'project_or_user'
-
-    def tearDown(self):
-        models.Author.AVAILABILITY = 'public'
-
     def test_error_returned_if_model_availability_project_and_no_project_flag(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user2@example.com', password='secret')
         self.assertEqual(login, True)
@@ -336,18 +128,12 @@ class APIItemListTestsProjectOrUserBadConfiguration(MyAPITestCase):
                          'Internal server error - model configuation incompatible with API (code 10003)')
 
 
+@override_availability(models.PublicationPlan, 'project_or_user')
 class APIItemListTestsProjectOrUserModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
     # there is no test model that matches this so adapting one for this test
 
-    def setUp(self):
-        self.add_data()
-        models.PublicationPlan.AVAILABILITY = 'project_or_user'
-
-    def tearDown(self):
-        models.PublicationPlan.AVAILABILITY = 'project'
-
     def test_get_project_list_returns_401_for_anonymous_user(self):
         client = APIClient()
         response = client.get(self.base_url.format('api_tests', 'publicationplan'))
@@ -415,17 +201,11 @@ class APIItemListTestsProjectOrUserModels(MyAPITestCase):
         self.assertEqual(response_json['count'], 2)
 
 
+@override_availability(models.Author, 'public_or_project')
 class APIItemListTestsPublicOrProjectBadConfigurationPublicMissing(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
-    def setUp(self):
-        models.Author.AVAILABILITY = 'public_or_project'
-
-    def tearDown(self):
-        models.Author.AVAILABILITY = 'public'
-
     def test_error_returned_if_no_public_or_project_in_model(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user2@example.com', password='secret')
         self.assertEqual(login, True)
@@ -436,17 +216,11 @@ class APIItemListTestsPublicOrProjectBadConfigurationPublicMissing(MyAPITestCase
                          'Internal server error - model configuation incompatible with API (code 10002)')
 
 
+@override_availability(models.Decision, 'public_or_project')
 class APIItemListTestsPublicOrProjectBadConfigurationProjectMissing(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
-    def setUp(self):
-        models.Decision.AVAILABILITY = 'public_or_project'
-
-    def tearDown(self):
-        models.Decision.AVAILABILITY = 'public_or_user'
-
     def test_error_returned_if_public_but_no_project_in_model(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user2@example.com', password='secret')
         self.assertEqual(login, True)
@@ -457,18 +231,12 @@ class APIItemListTestsPublicOrProjectBadConfigurationProjectMissing(MyAPITestCas
                          'Internal server error - model configuation incompatible with API (code 10002)')
 
 
+@override_availability(models.PublicationPlan, 'public_or_project')
 class APIItemListTestsPublicOrProjectModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
     # there is no test model that matches this so adapting one for this test
 
-    def setUp(self):
-        self.add_data()
-        models.PublicationPlan.AVAILABILITY = 'public_or_project'
-
-    def tearDown(self):
-        models.PublicationPlan.AVAILABILITY = 'project'
-
     def test_get_list_returns_public_items_for_anonymous_user(self):
         client = APIClient()
         response = client.get(self.base_url.format('api_tests', 'publicationplan'))
@@ -1,173 +1,17 @@
 import json
-from django.test import TestCase
-from django.contrib.auth.models import Group
-from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
-from api_tests import models
-
-
-User = get_user_model()
-
-
-class MyAPITestCase(TestCase):
-
-    def add_user(self, credentials):
-        user = User.objects.create_user(**credentials)
-        user.save()
-        return user
-
-    def add_superuser(self, credentials):
-        g1 = Group(name='api_tests_superusers')
-        g1.save()
-        user = User.objects.create_user(**credentials)
-        user.groups.add(g1)
-        user.save()
-        return user
-
-    def add_data(self):
-
-        # add users
-        self.u1 = self.add_user({'username': 'User1',
-                                 'email': 'user1@example.com',
-                                 'password': 'secret'})
-        self.u2 = self.add_user({'username': 'User2',
-                                 'email': 'user2@example.com',
-                                 'password': 'secret'})
-        self.u3 = self.add_superuser({'username': 'User3',
-                                      'email': 'user3@example.com',
-                                      'password': 'secret'})
-        self.u4 = self.add_user({'username': 'User4',
-                                 'email': 'user4@example.com',
-                                 'password': 'secret'})
-
-        e1_data = {'user': self.u1,
-                   'active': True}
-        self.e1 = models.Editor.objects.create(**e1_data)
-        e2_data = {'user': self.u2,
-                   'active': True}
-        self.e2 = models.Editor.objects.create(**e2_data)
-        e3_data = {'user': self.u3,
-                   'active': True}
-        self.e3 = models.Editor.objects.create(**e3_data)
-        e4_data = {'user': self.u4,
-                   'active': True}
-        self.e4 = models.Editor.objects.create(**e4_data)
-
-        a1_data = {'identifier': 'JS1',
-                   'name': 'John Smith',
-                   'age': 28,
-                   'active': True
-                   }
-        self.a1 = models.Author.objects.create(**a1_data)
-        a2_data = {'identifier': 'JS2',
-                   'name': 'Jane Smart',
-                   'age': 34,
-                   'active': True
-                   }
-        self.a2 = models.Author.objects.create(**a2_data)
-
-        w1_data = {'identifier': 'W1',
-                   'title': 'My First Book',
-                   'author': self.a1
-                   }
-        self.w1 = models.Work.objects.create(**w1_data)
-
-        w2_data = {'identifier': 'W2',
-                   'title': 'My Second Book',
-                   'author': self.a1
-                   }
-        self.w2 = models.Work.objects.create(**w2_data)
-
-        w3_data = {'identifier': 'W3',
-                   'title': 'My Best Book',
-                   'author': self.a2
-                   }
-        self.w3 = models.Work.objects.create(**w3_data)
-
-        w4_data = {'identifier': 'W4',
-                   'title': 'Another Great Book',
-                   'author': self.a2
-                   }
-        self.w4 = models.Work.objects.create(**w4_data)
-
-        d1_data = {'work': self.w1,
-                   'accept': True,
-                   'summary_notes': 'accepted for publication',
-                   'public': True,
-                   'user': self.u4}
-        self.d1 = models.Decision.objects.create(**d1_data)
-
-        d2_data = {'work': self.w2,
-                   'summary_notes': 'needs further cosideration',
-                   'public': False,
-                   'user': self.u4}
-        self.d2 = models.Decision.objects.create(**d2_data)
-
-        d3_data = {'work': self.w3,
-                   'accept': True,
-                   'summary_notes': 'third review requested',
-                   'user': self.u2}
-        self.d3 = models.Decision.objects.create(**d3_data)
-
-        d4_data = {'work': self.w4,
-                   'accept': False,
-                   'summary_notes': 'Not ready yet',
-                   'public': True,
-                   'user': self.u2}
-        self.d4 = models.Decision.objects.create(**d4_data)
-
-        r1_data = {'notes': 'Good',
-                   'score': 7,
-                   'work': self.w1,
-                   'user': self.u1
-                   }
-        self.r1 = models.Review.objects.create(**r1_data)
-
-        r2_data = {'notes': 'Great',
-                   'score': 10,
-                   'work': self.w1,
-                   'user': self.u2
-                   }
-        self.r2 = models.Review.objects.create(**r2_data)
-
-        r3_data = {'notes': 'Good',
-                   'score': 6,
-                   'work': self.w2,
-                   'user': self.u1
-                   }
-        self.r3 = models.Review.objects.create(**r3_data)
-
-        r4_data = {'notes': 'not great',
-                   'score': 3,
-                   'work': self.w2,
-                   'user': self.u3
-                   }
-        self.r4 = models.Review.objects.create(**r4_data)
-
-        r5_data = {'notes': 'okay',
-                   'score': 5,
-                   'work': self.w2,
-                   'user': self.u4
-                   }
-        self.r5 = models.Review.objects.create(**r5_data)
-
-        r6_data = {'notes': 'Looking good',
-                   'score': 8,
-                   'work': self.w3,
-                   'user': self.u4
-                   }
-        self.r6 = models.Review.objects.create(**r6_data)
+from api_tests.availability import override_availability
+from api_tests import models, fixtures
 
 
-class TestNoAvailabilitySetIsAssignedPrivate(MyAPITestCase):
-    base_url = '/api/{}/{}/'
+class MyAPITestCase(fixtures.SharedDataTestCase):
+    # the users, editors, authors, works, decisions and reviews are made once per class by fixtures.build_data
+    pass
 
-    def setUp(self):
-        models.Review.AVAILABILITY = None
-        self.add_data()
 
-    def tearDown(self):
-        models.Review.AVAILABILITY = 'private'
+@override_availability(models.Review, None)
+class TestNoAvailabilitySetIsAssignedPrivate(MyAPITestCase):
+    base_url = '/api/{}/{}/'
 
     def test_availability_assignment_by_using_not_logged_in_user(self):
         response = self.client.get(self.base_url.format('api_tests', 'review'))
@@ -191,16 +35,10 @@ class TestNoAvailabilitySetIsAssignedPrivate(MyAPITestCase):
         self.assertEqual(response_json['count'], 6)
 
 
+@override_availability(models.Review, 'nonsense')
 class TestInvalidAvailabilityAssignment(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
-    def setUp(self):
-        models.Review.AVAILABILITY = 'nonsense'
-        self.add_data()
-
-    def tearDown(self):
-        models.Review.AVAILABILITY = 'private'
-
     def test_invalid_availability_assignment_by_using_not_logged_in_user(self):
         response = self.client.get(self.base_url.format('api_tests', 'review'))
         response_json = json.loads(response.content.decode('utf8'))
@@ -213,12 +51,10 @@ class APIItemListTestsLoggedInModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
     def test_get_list_returns_401_if_not_logged_in(self):
-        self.add_data()
         response = self.client.get(self.base_url.format('api_tests', 'editor'))
         self.assertEqual(response.status_code, 401)
 
     def test_get_list_returns_all_editors_if_logged_in(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user1@example.com', password='secret')
         self.assertEqual(login, True)
@@ -231,12 +67,10 @@ class APIItemDetailTestsLoggedInModels(MyAPITestCase):
     base_url = '/api/{}/{}/{}'
 
     def test_get_list_returns_401_if_not_logged_in(self):
-        self.add_data()
         response = self.client.get(self.base_url.format('api_tests', 'editor', self.e1.id))
         self.assertEqual(response.status_code, 401)
 
     def test_get_list_returns_all_editors_if_logged_in(self):
-        self.add_data()
         client = APIClient()
         login = client.login(username='user1@example.com', password='secret')
         self.assertEqual(login, True)
@@ -249,13 +83,11 @@ class APIItemListTestsPublicModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
     def test_get_list_returns_json_200(self):
-        self.add_data()
         response = self.client.get(self.base_url.format('api_tests', 'author'))
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['content-type'], 'application/json')
 
     def test_get_list_returns_correct_data(self):
-        self.add_data()
         response = self.client.get(self.base_url.format('api_tests', 'author'))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['count'], 2)
@@ -264,7 +96,6 @@ class APIItemListTestsPublicModels(MyAPITestCase):
         self.assertEqual(response_json['results'][1]['identifier'], self.a2.identifier)
 
     def test_get_list_returns_correct_data_with_sort(self):
-        self.add_data()
         response = self.client.get('%s?_sort=name' % self.base_url.format('api_tests', 'author'))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['count'], 2)
@@ -273,7 +104,6 @@ class APIItemListTestsPublicModels(MyAPITestCase):
         self.assertEqual(response_json['results'][1]['identifier'], self.a1.identifier)
 
     def test_get_list_returns_correct_data_with_field_filtering(self):
-        self.add_data()
         response = self.client.get('%s?_fields=id,name' % self.base_url.format('api_tests', 'author'))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['count'], 2)
@@ -284,20 +114,17 @@ class APIItemListTestsPublicModels(MyAPITestCase):
         self.assertNotIn('active', response_json['results'][0])
 
     def test_get_list_returns_correct_data_with_pagination(self):
-        self.add_data()
         response = self.client.get('%s?limit=1' % self.base_url.format('api_tests', 'author'))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['count'], 2)
         self.assertEqual(len(response_json['results']), 1)
 
     def test_get_list_returns_correct_data_with_multiple_parameters(self):
-        self.add_data()
         response = self.client.get('%s?age=28&name=*S*' % self.base_url.format('api_tests', 'author'))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['count'], 1)
 
     def test_get_list_returns_correct_data_with_repeated_parameters(self):
-        self.add_data()
         response = self.client.get('%s?age=<40&age=>30' % self.base_url.format('api_tests', 'author'))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['count'], 1)
@@ -307,13 +134,11 @@ class APIItemDetailTestsPublicModels(MyAPITestCase):
     base_url = '/api/{}/{}/{}'
 
     def test_get_list_returns_json_200(self):
-        self.add_data()
         response = self.client.get(self.base_url.format('api_tests', 'author', self.a1.id))
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['content-type'], 'application/json')
 
     def test_get_list_returns_correct_data(self):
-        self.add_data()
         response = self.client.get(self.base_url.format('api_tests', 'author', self.a1.id))
         response_json = json.loads(response.content.decode('utf8'))
         self.assertEqual(response_json['id'], self.a1.id)
@@ -323,9 +148,6 @@ class APIItemDetailTestsPublicModels(MyAPITestCase):
 class APIItemListTestsPublicOrUserModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
-    def setUp(self):
-        self.add_data()
-
     def test_get_restricted_list_returns_all_public_for_anonymous_user(self):
         response = self.client.get(self.base_url.format('api_tests', 'decision'))
         response_json = json.loads(response.content.decode('utf8'))
@@ -397,9 +219,6 @@ class APIItemListTestsPublicOrUserModels(MyAPITestCase):
 class APIItemDetailTestsPublicOrUserModels(MyAPITestCase):
     base_url = '/api/{}/{}/{}'
 
-    def setUp(self):
-        self.add_data()
-
     def test_public_item_returned_for_anonymous_user(self):
         response = self.client.get(self.base_url.format('api_tests', 'decision', self.d1.id))
         response_json = json.loads(response.content.decode('utf8'))
@@ -480,19 +299,13 @@ class APIItemDetailTestsPublicOrUserModels(MyAPITestCase):
         self.assertEqual(response_json['summary_notes'], self.d2.summary_notes)
 
 
+@override_availability(models.Work, 'public_or_user')
 class APIItemListTestsPublicOrUserNoPublicField(MyAPITestCase):
     base_url = '/api/{}/{}/'
     # NB: There is no model that conforms to being 'public_or_user' availability
     # and with no public field because that should never happen. So I will
     # temporarily make an public one with no public field into a public_or_user one
-    # using setUp and tearDown (which is why this test is in its own class)
-
-    def setUp(self):
-        models.Work.AVAILABILITY = 'public_or_user'
-        self.add_data()
-
-    def tearDown(self):
-        models.Work.AVAILABILITY = 'public'
+    # using override_availability (which is why this test is in its own class)
 
     def test_get_restricted_list_returns_500_for_anonymous_user_if_no_public_field_on_model(self):
         # 500 because it makes no sense and is a server config error really
@@ -504,9 +317,6 @@ class APIItemListTestsPublicOrUserNoPublicField(MyAPITestCase):
 class APIItemListTestsPrivateModels(MyAPITestCase):
     base_url = '/api/{}/{}/'
 
-    def setUp(self):
-        self.add_data()
-
     def test_get_private_list_returns_401_for_anonymous_user(self):
         response = self.client.get(self.base_url.format('api_tests', 'review'))
         json.loads(response.content.decode('utf8'))
@@ -535,9 +345,6 @@ class APIItemListTestsPrivateModels(MyAPITestCase):
 class APIItemDetailTestsPrivateModels(MyAPITestCase):
     base_url = '/api/{}/{}/{}'
 
-    def setUp(self):
-        self.add_data()
-
     def test_404_returned_if_no_item_for_anonymous_user(self):
         # use stupidly high id number so its not likely to exist
         response = self.client.get(self.base_url.format('api_tests', 'review', 100001))
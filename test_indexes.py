@@ -0,0 +1,65 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from api_tests import fixtures
+
+
+# These check that the list queries api.views.ItemList runs for each availability mode are answered from the
+# indexes in migration 0014 rather than by scanning and sorting the whole table.
+class AvailabilityIndexTests(fixtures.SharedDataTestCase):
+    base_url = '/api/api_tests/{}/'
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        fixtures.build_projects(cls)
+
+    def get_list_sql(self, model_name, user=None, query=''):
+        # the SQL of the page query the view runs, with its parameters filled in
+        client = APIClient()
+        if user is not None:
+            client.force_login(user)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(self.base_url.format(model_name) + query)
+        self.assertEqual(response.status_code, 200)
+        table = 'FROM "api_tests_{}"'.format(model_name)
+        selects = [captured['sql'] for captured in queries.captured_queries
+                   if captured['sql'].startswith('SELECT') and table in captured['sql']
+                   and 'COUNT(' not in captured['sql']]
+        self.assertNotEqual(selects, [])
+        return selects[-1]
+
+    def get_plan(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # the test tables are tiny so the planner would always pick a sequential scan
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('EXPLAIN ' + sql)
+                return '\n'.join([row[0] for row in cursor.fetchall()])
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            return '\n'.join([row[-1] for row in cursor.fetchall()])
+
+    def assertIndexUsed(self, sql, index_name):
+        plan = self.get_plan(sql)
+        if connection.vendor == 'sqlite':
+            # every sqlite index ends in the rowid so the FK index on the column already serves the id ordering
+            # and which of the two the planner picks is a tie break, only check that one is used without a sort
+            self.assertRegex(plan, r'USING (COVERING )?INDEX ')
+        else:
+            self.assertIn(index_name, plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+    def test_private_list_uses_user_index(self):
+        sql = self.get_list_sql('review', self.u1)
+        self.assertIndexUsed(sql, 'at_review_user_id_idx')
+
+    def test_public_or_user_anonymous_list_uses_partial_index(self):
+        sql = self.get_list_sql('decision')
+        self.assertIndexUsed(sql, 'at_decision_public_idx')
+        # no other index can answer this query so the name is checked on sqlite too
+        self.assertIn('at_decision_public_idx', self.get_plan(sql))
+
+    def test_project_list_uses_project_index(self):
+        sql = self.get_list_sql('publicationplan', self.u4, '?project__id={}'.format(self.p1.id))
+        self.assertIndexUsed(sql, 'at_publicationplan_proj_idx')
@@ -2,71 +2,30 @@ import json
 import datetime
 from django.conf import settings as django_settings
 from django.utils import timezone
-from django.contrib.auth.models import Group, Permission
-from django.contrib.contenttypes.models import ContentType
-from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient, APITestCase
-from api_tests import models
-
-User = get_user_model()
+from api_tests import models, fixtures
 
 
+@fixtures.use_fast_password_hasher
 class APIPostTests(APITestCase):
     base_url = '/api/{}/{}/'
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.data_editors = fixtures.add_group('data_editors', [(models.Author, 'add_author'),
+                                                               (models.Author, 'change_author')])
+        cls.data_managers = fixtures.add_group('data_managers', [(models.Author, 'add_author'),
+                                                                 (models.Author, 'change_author'),
+                                                                 (models.Author, 'delete_author'),
+                                                                 (models.PublicationPlan, 'add_publicationplan'),
+                                                                 (models.PublicationPlan, 'change_publicationplan'),
+                                                                 (models.PublicationPlan, 'delete_publicationplan')])
+
     def add_data_manager_user(self, credentials):
-        try:
-            g2 = Group.objects.filter(name='data_managers')[0]
-        except IndexError:
-            g2 = Group(name='data_managers')
-            g2.save()
-            self.add_data_manager_permissions(g2)
-        user = User.objects.create_user(**credentials)
-        user.groups.add(g2)
-        user.save()
-        return user
+        return fixtures.add_user(credentials, [self.data_managers])
 
     def add_data_editor_user(self, credentials):
-        try:
-            g2 = Group.objects.filter(name='data_editors')[0]
-        except IndexError:
-            g2 = Group(name='data_editors')
-            g2.save()
-            self.add_data_editor_permissions(g2)
-        user = User.objects.create_user(**credentials)
-        user.groups.add(g2)
-        user.save()
-        return user
-
-    def add_data_editor_permissions(self, group):
-        content_type = ContentType.objects.get_for_model(models.Author)
-        permission = Permission.objects.get(content_type=content_type, codename='add_author')
-        group.permissions.add(permission)
-        content_type = ContentType.objects.get_for_model(models.Author)
-        permission = Permission.objects.get(content_type=content_type, codename='change_author')
-        group.permissions.add(permission)
-        group.save()
-
-    def add_data_manager_permissions(self, group):
-        content_type = ContentType.objects.get_for_model(models.Author)
-        permission = Permission.objects.get(content_type=content_type, codename='add_author')
-        group.permissions.add(permission)
-        content_type = ContentType.objects.get_for_model(models.Author)
-        permission = Permission.objects.get(content_type=content_type, codename='change_author')
-        group.permissions.add(permission)
-        content_type = ContentType.objects.get_for_model(models.Author)
-        permission = Permission.objects.get(content_type=content_type, codename='delete_author')
-        group.permissions.add(permission)
-        content_type = ContentType.objects.get_for_model(models.PublicationPlan)
-        permission = Permission.objects.get(content_type=content_type, codename='add_publicationplan')
-        group.permissions.add(permission)
-        content_type = ContentType.objects.get_for_model(models.PublicationPlan)
-        permission = Permission.objects.get(content_type=content_type, codename='change_publicationplan')
-        group.permissions.add(permission)
-        content_type = ContentType.objects.get_for_model(models.PublicationPlan)
-        permission = Permission.objects.get(content_type=content_type, codename='delete_publicationplan')
-        group.permissions.add(permission)
-        group.save()
+        return fixtures.add_user(credentials, [self.data_editors])
 
     def test_getUser(self):
         user = self.add_data_editor_user({'username': 'testuser@example.com',
@@ -0,0 +1,70 @@
+from unittest import skipUnless
+from django.test import TestCase
+from django.db import connection
+from api_tests import models, fixtures
+
+# These check the full text search indexes created by migration 0015 for the models' SEARCH_FIELDS.
+
+
+@skipUnless(connection.vendor in ['postgresql', 'sqlite'], 'search indexes are only created on PostgreSQL and SQLite')
+class SearchIndexTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.u1 = fixtures.add_user({'username': 'User1', 'email': 'user1@example.com', 'password': 'secret'})
+        cls.a1 = models.Author.objects.create(identifier='JS1', name='John Smith')
+        cls.a2 = models.Author.objects.create(identifier='JS2', name='Jane Smart')
+        cls.w1 = models.Work.objects.create(identifier='W1', title='My First Book', author=cls.a1)
+        cls.r1 = models.Review.objects.create(notes='good plot weak pacing', score=6, work=cls.w1, user=cls.u1)
+        cls.r2 = models.Review.objects.create(notes='okay', score=5, work=cls.w1, user=cls.u1)
+        cls.r3 = models.Review.objects.create(notes=None, score=1, work=cls.w1, user=cls.u1)
+
+    def setUp(self):
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA compile_options')
+                if 'ENABLE_FTS5' not in [row[0] for row in cursor.fetchall()]:
+                    self.skipTest('this SQLite build has no FTS5 so migration 0015 creates no search index')
+
+    def get_sql(self, model, term):
+        table = model._meta.db_table
+        if connection.vendor == 'postgresql':
+            columns = " || ' ' || ".join(["coalesce(\"{}\", '')".format(field) for field in model.SEARCH_FIELDS])
+            sql = 'SELECT id FROM "{}" WHERE to_tsvector(\'english\', {}) @@ plainto_tsquery(\'english\', %s) ' \
+                  'ORDER BY id'.format(table, columns)
+        else:
+            sql = 'SELECT rowid FROM {0}_fts WHERE {0}_fts MATCH %s ORDER BY rowid'.format(table)
+        return sql, [term]
+
+    def match(self, model, term):
+        with connection.cursor() as cursor:
+            cursor.execute(*self.get_sql(model, term))
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_index_finds_matching_rows(self):
+        self.assertEqual(self.match(models.Author, 'smith'), [self.a1.id])
+        self.assertEqual(self.match(models.Work, 'first'), [self.w1.id])
+        self.assertEqual(self.match(models.Work, 'second'), [])
+        # both backends stem the words
+        self.assertEqual(self.match(models.Review, 'plots'), [self.r1.id])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.a2.name = 'Jane Smith'
+        self.a2.save()
+        self.assertEqual(self.match(models.Author, 'smith'), [self.a1.id, self.a2.id])
+        # saves that leave the text as it was do not touch the index entry
+        self.w1.identifier = 'W1a'
+        self.w1.save()
+        self.assertEqual(self.match(models.Work, 'first'), [self.w1.id])
+        self.r2.delete()
+        self.assertEqual(self.match(models.Review, 'okay'), [])
+
+    @skipUnless(connection.vendor == 'postgresql', 'EXPLAIN output is only checked on PostgreSQL')
+    def test_search_uses_index(self):
+        sql, params = self.get_sql(models.Author, 'smith')
+        with connection.cursor() as cursor:
+            # the test tables are tiny so the planner would always pick a sequential scan
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('EXPLAIN ' + sql, params)
+            plan = '\n'.join([row[0] for row in cursor.fetchall()])
+        self.assertIn('api_tests_author_search_idx', plan)
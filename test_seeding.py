@@ -0,0 +1,71 @@
+from io import StringIO
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+from api_tests import models, seeding
+
+User = get_user_model()
+
+VOLUMES = {'users': 5,
+           'authors': 7,
+           'works_per_author': 2,
+           'editions_per_work': 2,
+           'reviews_per_work': 3,
+           'projects': 3,
+           'editors_per_project': 2,
+           'works_per_project': 2,
+           'plans_per_project': 2,
+           'editors_per_plan': 2}
+
+
+class SeedingTests(TestCase):
+
+    def get_snapshot(self):
+        return {'authors': list(models.Author.objects.order_by('identifier').values_list('identifier', 'name', 'age')),
+                'decisions': list(models.Decision.objects.order_by('id').values_list('accept', 'public')),
+                'reviews': list(models.Review.objects.order_by('id').values_list('notes', 'score'))}
+
+    def test_seed_creates_requested_volumes(self):
+        # a chunk size smaller than the number of authors so more than one chunk is made
+        seeding.seed(VOLUMES, chunk_size=3)
+        self.assertEqual(User.objects.count(), 5)
+        self.assertEqual(models.Editor.objects.count(), 5)
+        self.assertEqual(models.Author.objects.count(), 7)
+        self.assertEqual(models.Author.objects.values('identifier').distinct().count(), 7)
+        self.assertEqual(models.Work.objects.count(), 14)
+        self.assertEqual(models.Edition.objects.count(), 28)
+        self.assertEqual(models.Review.objects.count(), 42)
+        self.assertEqual(models.Decision.objects.count(), 14)
+        self.assertEqual(models.Project.objects.count(), 3)
+        self.assertEqual(models.PublicationPlan.objects.count(), 6)
+        self.assertEqual(models.Project.editors.through.objects.count(), 6)
+        self.assertEqual(models.PublicationPlan.editors.through.objects.count(), 12)
+        self.assertEqual(User.objects.filter(groups__name='api_tests_superusers').count(), 1)
+
+    def test_seed_is_deterministic(self):
+        seeding.seed(VOLUMES, random_seed=5)
+        first = self.get_snapshot()
+        models.Decision.objects.all().delete()
+        models.Review.objects.all().delete()
+        models.Edition.objects.all().delete()
+        models.Project.work.through.objects.all().delete()
+        models.Work.objects.all().delete()
+        models.Author.objects.all().delete()
+        models.PublicationPlan.editors.through.objects.all().delete()
+        models.PublicationPlan.objects.all().delete()
+        models.Project.editors.through.objects.all().delete()
+        models.Project.objects.all().delete()
+        models.Editor.objects.all().delete()
+        User.objects.all().delete()
+        seeding.seed(VOLUMES, random_seed=5)
+        self.assertEqual(self.get_snapshot(), first)
+
+    def test_command(self):
+        output = StringIO()
+        call_command('seed_api_tests', '--authors', '4', '--users', '3', '--projects', '2', stdout=output)
+        self.assertEqual(models.Author.objects.count(), 4)
+        self.assertEqual(models.Project.objects.count(), 2)
+        self.assertIn('Seeded the api_tests models', output.getvalue())
+        with self.assertRaises(CommandError):
+            call_command('seed_api_tests', '--authors', '4', stdout=StringIO())
@@ -0,0 +1,52 @@
+from unittest import skipUnless
+from django.test import TestCase
+from django.db import connection
+from api_tests import models
+
+# These check the indexes migration 0016 creates for the wildcard filters on the models' TRIGRAM_FIELDS.
+
+
+class TrigramIndexTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.a1 = models.Author.objects.create(identifier='JS1', name='John Smith')
+        models.Work.objects.create(identifier='W1', title='My First Book', author=cls.a1)
+
+    def get_plan(self, queryset):
+        # the test tables are tiny so the planner would always pick a sequential scan
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        return queryset.explain()
+
+    def test_wildcard_filters_work_without_indexes(self):
+        # these are the lookups get_query_tuple produces for *Smi*|i and john*|i
+        self.assertEqual(list(models.Author.objects.filter(name__icontains='smi')), [self.a1])
+        self.assertEqual(list(models.Author.objects.filter(name__istartswith='john')), [self.a1])
+
+    @skipUnless(connection.vendor == 'postgresql', 'trigram indexes are only created on PostgreSQL')
+    def test_indexes_exist_for_trigram_fields(self):
+        for model in [models.Author, models.Work]:
+            table = model._meta.db_table
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(cursor, table)
+            for field in model.TRIGRAM_FIELDS:
+                for suffix in ['trgm', 'utrgm', 'upper']:
+                    self.assertIn('{}_{}_{}'.format(table, field, suffix), constraints)
+
+    @skipUnless(connection.vendor == 'postgresql', 'trigram indexes are only created on PostgreSQL')
+    def test_case_sensitive_wildcards_use_trigram_index(self):
+        for lookup in ['name__contains', 'name__startswith', 'name__endswith']:
+            plan = self.get_plan(models.Author.objects.filter(**{lookup: 'Smi'}))
+            self.assertIn('api_tests_author_name_trgm', plan)
+
+    @skipUnless(connection.vendor == 'postgresql', 'trigram indexes are only created on PostgreSQL')
+    def test_case_insensitive_wildcards_use_upper_indexes(self):
+        plan = self.get_plan(models.Author.objects.filter(name__icontains='smi'))
+        self.assertIn('api_tests_author_name_utrgm', plan)
+        plan = self.get_plan(models.Work.objects.filter(title__iendswith='book'))
+        self.assertIn('api_tests_work_title_utrgm', plan)
+        plan = self.get_plan(models.Author.objects.filter(name__istartswith='john'))
+        self.assertRegex(plan, 'api_tests_author_name_(utrgm|upper)')
+        plan = self.get_plan(models.Author.objects.filter(name__iexact='john smith'))
+        self.assertRegex(plan, 'api_tests_author_name_(utrgm|upper)')
@@ -1,4 +1,5 @@
 import datetime
+import threading
 from django.utils import timezone
 from django.test import TestCase
 from django.contrib.auth import get_user_model
@@ -6,7 +7,8 @@ from django.test.client import RequestFactory
 from rest_framework.request import Request
 from django.db.models import Q
 from api import views
-from api_tests import models, serializers
+from api_tests import models, serializers, registry
+from api_tests.availability import override_availability
 from unittest.mock import patch
 
 User = get_user_model()
@@ -352,3 +354,100 @@ class ItemDetailUnitTests(TestCase):
         item_detail_view.kwargs = {'app': 'api_tests', 'model': 'work'}
         serializer_class = item_detail_view.get_serializer_class()
         self.assertEqual(serializer_class, serializers.WorkSerializer)
+
+
+class RegistryTests(TestCase):
+
+    def tearDown(self):
+        registry.clear_cache()
+
+    def test_get_fields_matches_model_meta(self):
+        for model in [models.Author, models.Work, models.Review, models.Decision, models.Project,
+                      models.PublicationPlan, models.Editor, models.Edition]:
+            expected = {}
+            for field in model._meta.get_fields(include_hidden=True):
+                expected[field.name] = field.get_internal_type()
+            self.assertEqual(model.get_fields(), expected)
+
+    def test_project_get_fields_returns_project_fields(self):
+        fields = models.Project.get_fields()
+        self.assertEqual(fields['managing_editor'], 'ForeignKey')
+        self.assertEqual(fields['editors'], 'ManyToManyField')
+        self.assertNotIn('accept', fields)
+        self.assertNotIn('summary_notes', fields)
+
+    def test_get_user_fields(self):
+        self.assertEqual(models.Project.get_user_fields(),
+                         {'managing_editor': 'ForeignKey', 'editors': 'ManyToManyField'})
+
+    def test_get_fields_returns_copy(self):
+        fields = models.Author.get_fields()
+        fields['name'] = 'nonsense'
+        self.assertEqual(models.Author.get_fields()['name'], 'TextField')
+
+    def test_clear_cache(self):
+        registry.clear_cache()
+        with patch.object(registry, '_read_field_types', return_value={'patched': 'TextField'}):
+            self.assertEqual(models.Author.get_fields(), {'patched': 'TextField'})
+        registry.clear_cache()
+        self.assertEqual(models.Author.get_fields()['name'], 'TextField')
+
+
+class AvailabilityOverrideTests(TestCase):
+
+    def test_declared_availability_is_used_by_default(self):
+        self.assertEqual(models.Review.AVAILABILITY, 'private')
+        self.assertEqual(models.Review().AVAILABILITY, 'private')
+
+    def test_override_as_context_manager(self):
+        with override_availability(models.Review, None):
+            self.assertIsNone(models.Review.AVAILABILITY)
+            self.assertEqual(models.Work.AVAILABILITY, 'public')
+        self.assertEqual(models.Review.AVAILABILITY, 'private')
+
+    def test_nested_overrides_are_restored_in_order(self):
+        with override_availability(models.Author, 'project'):
+            with override_availability(models.Author, 'public_or_project'):
+                self.assertEqual(models.Author.AVAILABILITY, 'public_or_project')
+            self.assertEqual(models.Author.AVAILABILITY, 'project')
+        self.assertEqual(models.Author.AVAILABILITY, 'public')
+
+    def test_override_is_restored_after_an_exception(self):
+        with self.assertRaises(RuntimeError):
+            with override_availability(models.Decision, 'public_or_project'):
+                raise RuntimeError()
+        self.assertEqual(models.Decision.AVAILABILITY, 'public_or_user')
+
+    @override_availability(models.PublicationPlan, 'project_or_user')
+    def test_override_as_decorator(self):
+        self.assertEqual(models.PublicationPlan.AVAILABILITY, 'project_or_user')
+
+    def test_model_without_availability_raises(self):
+        with self.assertRaises(ValueError):
+            override_availability(models.Edition, 'public')
+
+    def test_override_is_local_to_each_thread(self):
+        # one decorator instance entered and exited in two threads at once
+        override = override_availability(models.Review, 'public')
+        barrier = threading.Barrier(2, timeout=5)
+        results = []
+
+        @override
+        def read():
+            barrier.wait()
+            results.append(models.Review.AVAILABILITY)
+            barrier.wait()
+
+        def run():
+            try:
+                read()
+            except Exception as error:
+                results.append(error)
+        threads = [threading.Thread(target=run) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        self.assertEqual(models.Review.AVAILABILITY, 'private')
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['public', 'public'])
+        self.assertEqual(models.Review.AVAILABILITY, 'private')